@@ -1,25 +1,27 @@
+import heapq
+import math
 from abc import (
     ABC,
     abstractmethod
 )
-from queue import (
-    Queue,
-    LifoQueue,
-    PriorityQueue
-)
+from collections import deque
+from itertools import count
 from typing import (
     Dict,
     List,
-    Union
+    Callable,
+    Tuple,
+    Union,
+    Optional
 )
 
 from components import (
     Grid,
-    GridGUI,
-    Node
+    GridGUI
 )
 from constants import (
     VisualizationMethod,
+    InformedSearchStrategy,
     UninformedSearchStrategy
 )
 import settings
@@ -34,22 +36,65 @@ class BaseSearch(ABC):
 
     frontier_type_map: Dict = {}
 
-    @abstractmethod
-    def _reconstruct_path(self, current_node: Node) -> List:
+    def _bind_visualizer(self):
+        """
+        Bind the per-step visualization hooks once, so the search loop never
+        has to check the visualization method. ``_on_pop`` runs when a state
+        is taken off the frontier, ``_on_step`` after it has been expanded.
+        """
+        self._on_pop  = self._skip_step
+        self._on_step = self._skip_step
+
+        if self.visualizer_method == VisualizationMethod.GUI:
+            self._on_pop = self._draw_gui_step
+        elif self.visualizer_method == VisualizationMethod.CLI:
+            self._on_step = self._print_cli_step
+
+    def _skip_step(self, state: Tuple[int, int]):
+        """
+        No-op visualization hook.
+        """
+
+    def _draw_gui_step(self, state: Tuple[int, int]):
+        """
+        Draw the current state on the GUI and wait for the next click.
+        """
+        # NOTE: The GUI is attached after construction, so check it per step
+        if isinstance(self.visualizer, GridGUI):
+            self.visualizer.draw_grid(path=self.path, current_position=state)
+            self.visualizer.wait_for_click()
+
+    def _print_cli_step(self, state: Tuple[int, int]):
+        """
+        Print the grid with the current state and wait for Enter.
+        """
+        self.grid.print_grid_cli(current_position=state)
+        input('Press Enter to continue...')
+
+    def _reconstruct_path(self, state: Tuple[int, int]) -> List:
         """
-        Reconstruct the path backwards from the goal to start node.
+        Reconstruct the path backwards from the goal to start state using the
+        parents map filled in by the search.
         """
-        raise NotImplementedError('_reconstruct_path method called from the Base class')
+        if state not in self.parents:
+            raise ValueError(f'State {state} was never reached by the search')
+
+        path = deque()
+        while state is not None:
+            path.appendleft(state)
+            state = self.parents[state]
+
+        return list(path)
 
     @abstractmethod
-    def _update_priority_queue(self, cost: int, node: Node):
+    def _update_priority_queue(self, state: Tuple[int, int], cost: int, depth: int, parent: Optional[Tuple[int, int]]):
         """
-        Update a PriorityQueue frontier.
+        Update a priority queue (heap) frontier.
         """
         raise NotImplementedError('_update_priority_queue called from the Base class')
 
     @abstractmethod
-    def update_frontier(self, node: Node, cost: int = None):
+    def update_frontier(self, state: Tuple[int, int], cost: int, depth: int = 0, parent: Optional[Tuple[int, int]] = None):
         """
         Update a non-priority queue frontier.
         """
@@ -77,13 +122,21 @@ class UninformedSearch(BaseSearch):
     """
 
     frontier_type_map = {
-        UninformedSearchStrategy.DepthFirstSearch: LifoQueue,
-        UninformedSearchStrategy.DepthLimitedSearch: LifoQueue,
-        UninformedSearchStrategy.BreadthFirstSearch: Queue,
-        UninformedSearchStrategy.UniformCostSearch: PriorityQueue
+        UninformedSearchStrategy.DepthFirstSearch: 'lifo',
+        UninformedSearchStrategy.DepthLimitedSearch: 'lifo',
+        UninformedSearchStrategy.BreadthFirstSearch: 'fifo',
+        UninformedSearchStrategy.UniformCostSearch: 'pq'
     }
     frontier_type_map[UninformedSearchStrategy.IterativeDeepeningSearch] = frontier_type_map.get(UninformedSearchStrategy.DepthLimitedSearch)
 
+    # NOTE: A deque serves as both the FIFO queue and the LIFO stack; the heap
+    # is a plain list managed through heapq.
+    frontier_constructor_map = {
+        'fifo': deque,
+        'lifo': deque,
+        'pq': list
+    }
+
     def __init__(
         self,
         grid: Grid,
@@ -95,6 +148,7 @@ class UninformedSearch(BaseSearch):
         # TODO: Generate CLI visualizer class
         self.visualizer_method = visualizer_method
         self.visualizer        = visualizer
+        self._bind_visualizer()
 
         if not isinstance(grid, Grid):
             raise TypeError('Grid must be an instance of Grid')
@@ -104,145 +158,430 @@ class UninformedSearch(BaseSearch):
             raise ValueError(f"Invalid strategy: {strategy}")
         self.strategy = strategy
 
-        self.start_node: Node = Node(state=self.grid.start, parent=None, cost=0)
-        self.frontier         = UninformedSearch.frontier_type_map[strategy]()
-        self.frontier_set     = set()  # Maintain O(1) lookup times for PriorityQueue
+        # NOTE: The frontier holds raw (state, cost, depth) tuples, wrapped as
+        # (cost, counter, entry) on the heap. Parents are tracked separately so
+        # the path can be rebuilt from the goal.
+        self.frontier_type    = UninformedSearch.frontier_type_map[strategy]
+        self.frontier         = UninformedSearch.frontier_constructor_map[self.frontier_type]()
+        self.frontier_set     = set()  # Maintain O(1) lookup times for the heap
+        self.frontier_counter = count()  # Heap tiebreaker so states are never compared
         self.explored         = set()
+        self.parents: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {}
+        self.best_cost: Dict[Tuple[int, int], int] = {}  # Cheapest known cost per heap state
+        self._bind_frontier()
 
         self.path: List      = []
         self.final_cost: int = 0
 
         # Restrict the depth limit to no more than 100 for performance reasons
-        self.depth_limit: int      = min(depth_limit, 100) if depth_limit else None
+        self.depth_limit: int      = min(depth_limit, 100) if depth_limit is not None else None
         self.depth_limit_hit: bool = False
 
-    def _reconstruct_path(self, current_node: Node) -> List:
+        # NOTE: Nothing that decides the search implementation changes after
+        # construction, so it is picked once here instead of on every run.
+        self._search_impl: Callable[[], None] = self._select_search_impl()
+
+    def _select_search_impl(self) -> Callable[[], None]:
         """
-        Reconstructs the path from the goal to the start node.
+        Pick the search implementation for the initialized strategy. Visualized
+        runs use the generic search loop; otherwise the specialized loops are
+        used.
         """
-        if not isinstance(current_node, Node):
-            raise TypeError('Current node must be an instance of Node')
+        if self.strategy == UninformedSearchStrategy.IterativeDeepeningSearch:
+            return self.iterative_deepening_search
+        elif self.visualizer_method != VisualizationMethod.Nothing:
+            return self.search
+
+        search_impl_map = {
+            UninformedSearchStrategy.DepthFirstSearch: self._dfs,
+            UninformedSearchStrategy.DepthLimitedSearch: self._dfs,
+            UninformedSearchStrategy.BreadthFirstSearch: self._bfs,
+            UninformedSearchStrategy.UniformCostSearch: self._ucs
+        }
 
-        path = []
-        while current_node:
-            path.append(current_node.state)
-            current_node = current_node.parent
+        return search_impl_map[self.strategy]
 
-        return path[::-1]
+    def _bind_frontier(self):
+        """
+        Bind the push and pop operations for the current frontier once, so the
+        search loop never has to branch on the frontier type.
+        """
+        if self.frontier_type == 'pq':
+            self._push = self._update_priority_queue
+            self._pop  = self._pop_priority_queue
+        elif self.frontier_type == 'fifo':
+            self._push = self._update_queue
+            self._pop  = self.frontier.popleft
+        else:
+            self._push = self._update_queue
+            self._pop  = self.frontier.pop
 
-    def _update_priority_queue(self, cost: int, node: Node):
+    def _update_queue(self, state: Tuple[int, int], cost: int, depth: int, parent: Optional[Tuple[int, int]]):
         """
-        Update the priority queue for the Uniform Cost Search with the
-        cost and node.
+        Append a (state, cost, depth) entry to a FIFO/LIFO frontier unless the
+        state is already queued.
         """
-        if not isinstance(cost, int):
-            raise TypeError('Cost must be an integer')
-        elif not isinstance(node, Node):
-            raise TypeError('Node must be an instance of Node')
+        if state in self.frontier_set:
+            return
 
-        if node.state not in self.frontier_set:
-            self.frontier.put((cost, node))
-            self.frontier_set.add(node.state)
+        self.parents[state] = parent
+        self.frontier.append((state, cost, depth))
+        self.frontier_set.add(state)
 
-    def update_frontier(self, node: Node, cost: int = None):
+    def _update_priority_queue(self, state: Tuple[int, int], cost: int, depth: int, parent: Optional[Tuple[int, int]]):
         """
-        Update the frontier based on the search strategy being used.
+        Push a (state, cost, depth) entry onto the heap-backed priority queue
+        for the Uniform Cost Search, keyed by its cost.
+
+        If the state is already queued with a higher cost, this acts as a
+        decrease-key: the new entry is pushed and the old one is left on the
+        heap as stale, to be skipped once its state has been explored.
         """
-        if not isinstance(node, Node):
-            raise TypeError('Node must be an instance of Node')
+        if cost >= self.best_cost.get(state, math.inf):
+            return
 
-        if not cost:
-            cost = node.cost
+        self.best_cost[state] = cost
+        self.parents[state]   = parent
+        heapq.heappush(self.frontier, (cost, next(self.frontier_counter), (state, cost, depth)))
+        self.frontier_set.add(state)
 
-        if type(self.frontier) == PriorityQueue:
-            self._update_priority_queue(cost=cost, node=node)
-        else:
-            self.frontier.put(node)
-            self.frontier_set.add(node.state)
+    def _pop_priority_queue(self) -> Tuple:
+        """
+        Pop the cheapest (state, cost, depth) entry off the heap-backed
+        priority queue.
+        """
+        return heapq.heappop(self.frontier)[2]
+
+    def update_frontier(self, state: Tuple[int, int], cost: int, depth: int = 0, parent: Optional[Tuple[int, int]] = None):
+        """
+        Update the frontier based on the search strategy being used.
+        """
+        self._push(state, cost, depth, parent)
 
     def search(self):
         """
         Run the search based on the initialized strategy.
         """
-        self.update_frontier(self.start_node)
+        self.update_frontier(self.grid.start, cost=0)
 
-        while not self.frontier.empty():
-            if type(self.frontier) == PriorityQueue:
-                # NOTE: We are always putting (cost, node) into the PriorityQueue
-                cost, current_node = self.frontier.get()
-            else:
-                # NOTE: We only put the node into the non-Priority queue
-                current_node = self.frontier.get()
+        # NOTE: The FIFO/LIFO frontiers test for the goal as it is generated,
+        # the same as _search_queue, so start == goal is handled up front. The
+        # heap keeps testing on pop, which Uniform Cost Search needs to stay
+        # optimal.
+        goal_on_generation = self.frontier_type != 'pq'
+        if goal_on_generation and self.grid.is_goal_state(self.grid.start):
+            logger.debug('%s: Goal state found -> %s', self.strategy.value, self.grid.goal)
+
+            self.path       = self._reconstruct_path(self.grid.start)
+            self.final_cost = 0
+
+            return
+
+        pop = self._pop
 
-            if self.visualizer_method == VisualizationMethod.GUI and isinstance(self.visualizer, GridGUI):
-                self.visualizer.draw_grid(path=self.path, current_position=current_node.state)
-                self.visualizer.wait_for_click()
+        while self.frontier:
+            state, cost, depth = pop()
 
-            if type(self.visualizer) == GridGUI:
-                self.visualizer.draw_grid(path=self.path, current_position=current_node.state)
+            # NOTE: Only the heap can hold more than one entry per state. Any
+            # entry popped after its state was explored is stale (a cheaper
+            # entry was already expanded), so it is skipped.
+            if state in self.explored:
+                continue
 
-            if current_node.state in self.frontier_set:
-                self.frontier_set.remove(current_node.state)
+            self._on_pop(state)
 
-            if self.grid.is_goal_state(node=current_node):
+            if state in self.frontier_set:
+                self.frontier_set.remove(state)
+
+            if self.grid.is_goal_state(state):
                 logger.debug('%s: Goal state found -> %s', self.strategy.value, self.grid.goal)
 
-                self.path       = self._reconstruct_path(current_node)
-                self.final_cost = current_node.cost
+                self.path       = self._reconstruct_path(state)
+                self.final_cost = cost
+
+                break
+
+            if self.depth_limit is not None and depth >= self.depth_limit:
+                logger.debug('%s: Depth limit hit!', self.strategy.value)
+
+                self.depth_limit_hit = True
+                self.final_cost      = cost
+
+                self.grid.print_grid_cli(current_position=state)
 
                 break
 
-            if self.depth_limit is not None and current_node.depth >= self.depth_limit:
+            self.explored.add(state)
+            print(f'{self.strategy.value}: Exploring node {state} at depth {depth}')
+
+            for neighbor, step_cost in self.grid.get_neighbors(state):
+                if neighbor not in self.explored:
+                    self.update_frontier(neighbor, cost=cost + step_cost, depth=depth + 1, parent=state)
+
+                    if goal_on_generation and self.grid.is_goal_state(neighbor):
+                        logger.debug('%s: Goal state found -> %s', self.strategy.value, self.grid.goal)
+
+                        self.path       = self._reconstruct_path(neighbor)
+                        self.final_cost = cost + step_cost
+
+                        return
+
+            self._on_step(state)
+
+    def _can_search_bidirectionally(self) -> bool:
+        """
+        A bidirectional search only matches a plain Breadth-First Search when
+        every step costs the same, there is no depth limit, and both endpoints
+        are open cells the reverse search can start from.
+        """
+        grid = self.grid
+
+        return (
+            self.depth_limit is None
+            and not grid.increased_cost_cells
+            and all(
+                0 <= x < grid.width and 0 <= y < grid.height and (x, y) not in grid.barriers
+                for x, y in (grid.start, grid.goal)
+            )
+        )
+
+    def _bidirectional_bfs(self):
+        """
+        Run a Breadth-First Search from the start and the goal at the same
+        time, expanding one full layer of the smaller side per step, until the
+        two meet in the middle. This explores roughly O(b^(d/2)) nodes instead
+        of O(b^d).
+        """
+        start, goal = self.grid.start, self.grid.goal
+
+        # NOTE: Each side maps a visited state to its (parent, depth) on that side.
+        forward: Dict[Tuple[int, int], Tuple] = {start: (None, 0)}
+        backward: Dict[Tuple[int, int], Tuple] = {goal: (None, 0)}
+        forward_layer  = [start]
+        backward_layer = [goal]
+
+        meeting = start if start == goal else None
+
+        while meeting is None and forward_layer and backward_layer:
+            if len(forward_layer) <= len(backward_layer):
+                visited, other, layer = forward, backward, forward_layer
+                depth_label = ''
+            else:
+                visited, other, layer = backward, forward, backward_layer
+                depth_label = ' from the goal'
+
+            # NOTE: The whole layer is expanded before stopping, since the first
+            # meeting found is not necessarily the one with the shortest path.
+            best_length = math.inf
+            next_layer  = []
+            for state in layer:
+                depth = visited[state][1]
+                self.explored.add(state)
+
+                print(f'{self.strategy.value}: Exploring node {state} at depth {depth}{depth_label}')
+
+                for neighbor, _ in self.grid.get_neighbors(state):
+                    if neighbor in visited:
+                        continue
+
+                    visited[neighbor] = (state, depth + 1)
+                    next_layer.append(neighbor)
+
+                    if neighbor in other and depth + 1 + other[neighbor][1] < best_length:
+                        best_length = depth + 1 + other[neighbor][1]
+                        meeting     = neighbor
+
+            if visited is forward:
+                forward_layer = next_layer
+            else:
+                backward_layer = next_layer
+
+        if meeting is None:
+            return
+
+        logger.debug('%s: Frontiers met at %s', self.strategy.value, meeting)
+
+        # NOTE: Stitch both halves into the parents map so the regular path
+        # reconstruction can walk back from the goal.
+        state = meeting
+        while state is not None:
+            self.parents[state] = forward[state][0]
+            state = forward[state][0]
+
+        state = meeting
+        while backward[state][0] is not None:
+            self.parents[backward[state][0]] = state
+            state = backward[state][0]
+
+        self.path       = self._reconstruct_path(goal)
+        self.final_cost = len(self.path) - 1
+
+    def _search_queue(self, pop: Callable[[], Tuple]):
+        """
+        Tight FIFO/LIFO search loop shared by the specialized BFS and DFS,
+        with no visualization branches. ``pop`` is the frontier's popleft or
+        pop, chosen once by the caller.
+        """
+        start, goal   = self.grid.start, self.grid.goal
+        get_neighbors = self.grid.get_neighbors
+        explored      = self.explored
+        frontier      = self.frontier
+        frontier_set  = self.frontier_set
+        parents       = self.parents
+        push          = frontier.append
+
+        # NOTE: An infinite limit keeps the depth check a single comparison
+        depth_limit = math.inf if self.depth_limit is None else self.depth_limit
+
+        parents[start] = None
+
+        # NOTE: The goal is tested as neighbors are generated, which skips its
+        # round-trip through the frontier. That misses start == goal, so it is
+        # handled up front.
+        if start == goal:
+            logger.debug('%s: Goal state found -> %s', self.strategy.value, goal)
+
+            self.path       = self._reconstruct_path(start)
+            self.final_cost = 0
+
+            return
+
+        push((start, 0, 0))
+        frontier_set.add(start)
+
+        while frontier:
+            state, cost, depth = pop()
+            frontier_set.discard(state)
+
+            if depth >= depth_limit:
                 logger.debug('%s: Depth limit hit!', self.strategy.value)
 
                 self.depth_limit_hit = True
-                self.final_cost      = current_node.cost
+                self.final_cost      = cost
 
-                self.grid.print_grid_cli(current_position=current_node.state)
+                self.grid.print_grid_cli(current_position=state)
 
                 break
 
-            self.explored.add(current_node.state)
-            for neighbor in self.grid.get_neighbors(current_node):
-                # NOTE: Since a Node is considered "immutable," we'd want to create
-                # a new one when updating the depth value. But we don't necessarily want
-                # to do that for every single search algorithm (for performance purposes).
-                if self.depth_limit is not None:
-                    new_neighbor = Node(
-                        state=neighbor.state,
-                        parent=current_node,
-                        cost=neighbor.cost,
-                        depth=current_node.depth + 1
-                    )
-                else:
-                    new_neighbor = neighbor
-
-                if new_neighbor.state not in self.explored and new_neighbor.state not in self.frontier_set:
-                    self.update_frontier(new_neighbor)
-
-            print(f'{self.strategy.value}: Exploring node {current_node.state} at depth {current_node.depth}')
-
-            if self.visualizer_method == VisualizationMethod.CLI:
-                self.grid.print_grid_cli(current_position=current_node.state)
-                input('Press Enter to continue...')
+            explored.add(state)
+            print(f'{self.strategy.value}: Exploring node {state} at depth {depth}')
+
+            for neighbor, step_cost in get_neighbors(state):
+                if neighbor not in explored and neighbor not in frontier_set:
+                    parents[neighbor] = state
+
+                    if neighbor == goal:
+                        logger.debug('%s: Goal state found -> %s', self.strategy.value, goal)
+
+                        self.path       = self._reconstruct_path(neighbor)
+                        self.final_cost = cost + step_cost
+
+                        return
+
+                    push((neighbor, cost + step_cost, depth + 1))
+                    frontier_set.add(neighbor)
+
+    def _bfs(self):
+        """
+        Breadth-First Search specialized for a deque frontier, run from both
+        ends when the grid allows it.
+        """
+        if self._can_search_bidirectionally():
+            self._bidirectional_bfs()
+        else:
+            self._search_queue(self.frontier.popleft)
+
+    def _dfs(self):
+        """
+        Depth-First Search specialized for a deque frontier. This also serves
+        the Depth-Limited Search, since the loop honors the depth limit.
+        """
+        self._search_queue(self.frontier.pop)
+
+    def _ucs(self):
+        """
+        Uniform-Cost Search specialized for the heap frontier, with the
+        decrease-key push inlined.
+        """
+        start, goal   = self.grid.start, self.grid.goal
+        get_neighbors = self.grid.get_neighbors
+        explored      = self.explored
+        frontier      = self.frontier
+        parents       = self.parents
+        best_cost     = self.best_cost
+        counter       = self.frontier_counter
+        heappush      = heapq.heappush
+        heappop       = heapq.heappop
+
+        depth_limit = math.inf if self.depth_limit is None else self.depth_limit
+
+        # NOTE: Heap entries follow the (cost, counter, (state, cost, depth))
+        # layout of _update_priority_queue. frontier_set is not needed here since
+        # best_cost decides whether a state gets (re)pushed.
+        parents[start]   = None
+        best_cost[start] = 0
+        heappush(frontier, (0, next(counter), (start, 0, 0)))
+
+        while frontier:
+            state, cost, depth = heappop(frontier)[2]
+
+            # NOTE: Skip stale entries superseded by a cheaper path
+            if state in explored:
+                continue
+
+            if state == goal:
+                logger.debug('%s: Goal state found -> %s', self.strategy.value, goal)
+
+                self.path       = self._reconstruct_path(state)
+                self.final_cost = cost
+
+                break
+
+            if depth >= depth_limit:
+                logger.debug('%s: Depth limit hit!', self.strategy.value)
+
+                self.depth_limit_hit = True
+                self.final_cost      = cost
+
+                self.grid.print_grid_cli(current_position=state)
+
+                break
+
+            explored.add(state)
+            for neighbor, step_cost in get_neighbors(state):
+                if neighbor in explored:
+                    continue
+
+                new_cost = cost + step_cost
+                if new_cost < best_cost.get(neighbor, math.inf):
+                    best_cost[neighbor] = new_cost
+                    parents[neighbor]   = state
+                    heappush(frontier, (new_cost, next(counter), (neighbor, new_cost, depth + 1)))
+
+            print(f'{self.strategy.value}: Exploring node {state} at depth {depth}')
 
     def iterative_deepening_search(self):
         """
         Perform a series of Depth-Limited Searches.
         """
         depth = 0
-        max_depth = self.depth_limit or 100
+        max_depth = 100 if self.depth_limit is None else self.depth_limit
+
+        # NOTE: Only a visualized run needs the generic search loop
+        depth_limited_search = self._dfs if self.visualizer_method == VisualizationMethod.Nothing else self.search
 
         while depth <= max_depth:
             self.depth_limit = depth
-            self.frontier = self.__class__.frontier_type_map[UninformedSearchStrategy.IterativeDeepeningSearch]()
+            self.frontier.clear()
             self.frontier_set.clear()
             self.explored.clear()
+            self.parents.clear()
+            self.best_cost.clear()
             self.path.clear()
             self.final_cost = 0
             self.depth_limit_hit = False
 
-            self.search()
+            depth_limited_search()
 
             if not self.path:
                 depth += 1
@@ -257,9 +596,120 @@ class UninformedSearch(BaseSearch):
         """
         logger.info('Running %s...', self.strategy.value)
 
-        if self.strategy == UninformedSearchStrategy.IterativeDeepeningSearch:
-            self.iterative_deepening_search()
-        else:
-            self.search()
+        self._search_impl()
+
+        logger.info('%s completed.', self.strategy.value)
+
+
+class InformedSearch(BaseSearch):
+    """
+    This class implements informed (heuristic) search strategies to find
+    a path from the start state to a goal state.
+    """
+
+    def __init__(
+        self,
+        grid: Grid,
+        strategy: InformedSearchStrategy,
+        visualizer_method: VisualizationMethod = VisualizationMethod.Nothing,
+        visualizer: Union[GridGUI, None] = None
+    ):
+        self.visualizer_method = visualizer_method
+        self.visualizer        = visualizer
+        self._bind_visualizer()
+
+        if not isinstance(grid, Grid):
+            raise TypeError('Grid must be an instance of Grid')
+        self.grid = grid
+
+        if strategy not in InformedSearchStrategy:
+            raise ValueError(f"Invalid strategy: {strategy}")
+        self.strategy = strategy
+
+        # NOTE: A* orders the heap by g + h, Greedy Best-First Search by h alone.
+        self.use_path_cost: bool = strategy == InformedSearchStrategy.AStarSearch
+
+        self.frontier: List   = []
+        self.frontier_counter = count()  # Heap tiebreaker so states are never compared
+        self.explored         = set()
+        self.parents: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {}
+        self.best_cost: Dict[Tuple[int, int], int] = {}
+
+        self.path: List      = []
+        self.final_cost: int = 0
+
+    def _heuristic(self, state: Tuple[int, int]) -> int:
+        """
+        Manhattan distance from the given state to the goal. This never
+        overestimates as long as every step costs at least 1 on the
+        4-connected grid, which get_grid enforces for increased-cost cells.
+        """
+        goal_x, goal_y = self.grid.goal
+
+        return abs(state[0] - goal_x) + abs(state[1] - goal_y)
+
+    def _update_priority_queue(self, state: Tuple[int, int], cost: int, depth: int, parent: Optional[Tuple[int, int]]):
+        """
+        Push a (state, cost, depth) entry onto the heap keyed by its
+        priority, superseding any queued entry for the same state that has a
+        higher path cost.
+        """
+        if cost >= self.best_cost.get(state, math.inf):
+            return
+
+        heuristic = self._heuristic(state)
+        priority  = cost + heuristic if self.use_path_cost else heuristic
+
+        # NOTE: Ties on priority are broken by the heuristic, so the entry
+        # closest to the goal is expanded first.
+        self.best_cost[state] = cost
+        self.parents[state]   = parent
+        heapq.heappush(self.frontier, (priority, heuristic, next(self.frontier_counter), (state, cost, depth)))
+
+    def update_frontier(self, state: Tuple[int, int], cost: int, depth: int = 0, parent: Optional[Tuple[int, int]] = None):
+        """
+        Update the heap frontier.
+        """
+        self._update_priority_queue(state, cost, depth, parent)
+
+    def search(self):
+        """
+        Run the search based on the initialized strategy.
+        """
+        self.update_frontier(self.grid.start, cost=0)
+
+        while self.frontier:
+            state, cost, depth = heapq.heappop(self.frontier)[-1]
+
+            # NOTE: Skip stale heap entries left behind by a cheaper path.
+            if state in self.explored:
+                continue
+
+            self._on_pop(state)
+
+            if self.grid.is_goal_state(state):
+                logger.debug('%s: Goal state found -> %s', self.strategy.value, self.grid.goal)
+
+                self.path       = self._reconstruct_path(state)
+                self.final_cost = cost
+
+                break
+
+            self.explored.add(state)
+            for neighbor, step_cost in self.grid.get_neighbors(state):
+                if neighbor not in self.explored:
+                    self.update_frontier(neighbor, cost=cost + step_cost, depth=depth + 1, parent=state)
+
+            print(f'{self.strategy.value}: Exploring node {state} at depth {depth}')
+
+            self._on_step(state)
+
+    def run(self):
+        """
+        Run the search method and log messages based on the result.
+        """
+        logger.info('Running %s...', self.strategy.value)
+
+        self.search()
 
         logger.info('%s completed.', self.strategy.value)
@@ -3,7 +3,7 @@ from typing import (
     Dict,
     List,
     Tuple,
-    Optional
+    FrozenSet
 )
 from dataclasses import (
     field,
@@ -18,6 +18,18 @@ import settings
 
 logger = settings.getLogger(__name__)
 
+CLI_SYMBOL_BY_CELL_KIND = {
+    'start': 'S',
+    'goal': 'G',
+    'barrier': '#',
+    'costly': '$'
+}
+GUI_COLORS_BY_CELL_KIND = {
+    'start': ('green', 'white'),
+    'goal': ('red', 'white'),
+    'barrier': ('black', 'white')
+}
+
 
 @dataclass
 class Grid:
@@ -26,18 +38,50 @@ class Grid:
 
     start: Tuple[int, int]
     goal: Tuple[int, int]
-    barriers: List[Tuple[int, int]] = field(default_factory=list)
+    barriers: FrozenSet[Tuple[int, int]] = field(default_factory=frozenset)
     increased_cost_cells: Dict[Tuple[int, int], int] = field(default_factory=dict)
 
-    def is_goal_state(self, node: 'Node') -> bool:
+    def __post_init__(self):
         """
-        Check if the current Node state is the goal state.
+        Store the barriers as a frozenset for O(1) membership checks, set up
+        the neighbor cache and classify every cell for rendering.
         """
-        return node.state == self.goal
-
-    def get_neighbors(self, node: 'Node') -> List['Node']:
+        self.barriers = frozenset(self.barriers)
+
+        # NOTE: Only the path and current position change between redraws, so
+        # the static kind of each cell is worked out once up front.
+        self.cell_kinds: Dict[Tuple[int, int], str] = {
+            (x, y): self._cell_kind(x, y)
+            for y in range(self.height)
+            for x in range(self.width)
+        }
+
+        # NOTE: The grid is fixed for the lifetime of a search, so the bounds,
+        # barrier and cost checks only need to be done once per cell. The cache
+        # is filled lazily so only reachable cells pay for it, and it is reused
+        # across every iteration of an Iterative Deepening Search.
+        self._neighbors: Dict[Tuple[int, int], List[Tuple[Tuple[int, int], int]]] = {}
+
+    def _cell_kind(self, x: int, y: int) -> str:
+        """
+        Returns the static kind of the given cell: 'start', 'goal', 'barrier',
+        'costly' or 'empty'.
         """
-        Returns the given Node's neighbors against the grid size and barriers.
+        if (x, y) == self.start:
+            return 'start'
+        elif (x, y) == self.goal:
+            return 'goal'
+        elif (x, y) in self.barriers:
+            return 'barrier'
+        elif (x, y) in self.increased_cost_cells:
+            return 'costly'
+
+        return 'empty'
+
+    def _neighbor_coords(self, x: int, y: int) -> List[Tuple[Tuple[int, int], int]]:
+        """
+        Returns the (state, step_cost) pairs reachable from the given cell
+        against the grid size and barriers.
         """
         directions = [
             (0, -1),  # Up
@@ -45,8 +89,7 @@ class Grid:
             (0, 1),   # Down
             (-1, 0)   # Left
         ]
-        x, y       = node.state
-        neighbors  = []
+        neighbors = []
 
         for dir_x, dir_y in directions:
             new_x = x + dir_x
@@ -54,27 +97,43 @@ class Grid:
 
             if (0 <= new_x < self.width) and (0 <= new_y < self.height):
                 if (new_x, new_y) not in self.barriers:
-                    new_cost = node.cost + self.increased_cost_cells.get((new_x, new_y), 1)
-                    neighbors.append(Node(state=(new_x, new_y), parent=node, cost=new_cost))
+                    step_cost = self.increased_cost_cells.get((new_x, new_y), 1)
+                    neighbors.append(((new_x, new_y), step_cost))
+
+        return neighbors
+
+    def is_goal_state(self, state: Tuple[int, int]) -> bool:
+        """
+        Check if the given state is the goal state.
+        """
+        return state == self.goal
+
+    def get_neighbors(self, state: Tuple[int, int]) -> List[Tuple[Tuple[int, int], int]]:
+        """
+        Returns the given state's (neighbor, step_cost) pairs against the grid
+        size and barriers, computing them on the first request.
+        """
+        neighbors = self._neighbors.get(state)
+        if neighbors is None:
+            neighbors = self._neighbors[state] = self._neighbor_coords(*state)
 
         return neighbors
 
     def print_grid_cli(self, current_position=None, path=None):
+        # NOTE: Every cell is tested against the path, so hash it once up front
+        path = frozenset(path) if path else frozenset()
+
         print("+" + "-" * (self.width * 2) + "+")
 
         for y in range(self.height):
             print("|", end="")
 
             for x in range(self.width):
-                if (x, y) == self.start:
-                    print("S", end=" ")
-                elif (x, y) == self.goal:
-                    print("G", end=" ")
-                elif (x, y) in self.barriers:
-                    print("#", end=" ")
-                elif (x, y) in self.increased_cost_cells:
-                    print("$", end=" ")
-                elif path and (x, y) in path:
+                kind = self.cell_kinds[(x, y)]
+
+                if kind != 'empty':
+                    print(CLI_SYMBOL_BY_CELL_KIND[kind], end=" ")
+                elif (x, y) in path:
                     print(".", end=" ")
                 elif current_position and (x, y) == current_position:
                     print("X", end=" ")
@@ -108,7 +167,7 @@ class GridGUI:
         self.click_event = Event()
         self.canvas.bind("<Button-1>", self.on_canvas_click)
 
-        self.draw_grid()
+        self._create_cells()
 
         self.search_class = search_class
         self.search_thread = None
@@ -128,8 +187,14 @@ class GridGUI:
         self.click_event.clear()
         self.click_event.wait()
 
-    def draw_grid(self, path=None, current_position=None):
-        self.canvas.delete("all")
+    def _create_cells(self):
+        """
+        Create every cell's rectangle and label once, painted with its static
+        colors. Later redraws only recolor the cells that changed.
+        """
+        self._cell_ids: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        self._cell_colors: Dict[Tuple[int, int], Tuple[str, str]] = {}
+        self._overlay: Dict[Tuple[int, int], Tuple[str, str]] = {}
 
         for y in range(self.grid.height):
             for x in range(self.grid.width):
@@ -138,65 +203,52 @@ class GridGUI:
                 x2 = x1 + self.cell_size
                 y2 = y1 + self.cell_size
 
-                fill = "white"
-                text_color = "black"
-
-                if (x, y) == self.grid.start:
-                    fill = "green"
-                    text_color = "white"
-                elif (x, y) == self.grid.goal:
-                    fill = "red"
-                    text_color = "white"
-                elif (x, y) in self.grid.barriers:
-                    fill = "black"
-                    text_color = "white"
-                elif path and (x, y) in path:
-                    fill = "blue"
-                    text_color = "white"
-                elif current_position and (x, y) == current_position:
-                    fill = "orange"
-                    text_color = "white"
+                fill, text_color = GUI_COLORS_BY_CELL_KIND.get(self.grid.cell_kinds[(x, y)], ("white", "black"))
 
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=fill, outline="gray")
-                self.canvas.create_text((x1 + x2) / 2, (y1 + y2) / 2, text=f"({x},{y})", fill=text_color)
+                rect_id = self.canvas.create_rectangle(x1, y1, x2, y2, fill=fill, outline="gray")
+                text_id = self.canvas.create_text((x1 + x2) / 2, (y1 + y2) / 2, text=f"({x},{y})", fill=text_color)
 
-    def on_close(self):
-        self.stop_event.set()
-        self.window.destroy()
+                self._cell_ids[(x, y)]    = (rect_id, text_id)
+                self._cell_colors[(x, y)] = (fill, text_color)
 
-    def run(self):
-        self.window.mainloop()
+    def _paint_cell(self, cell: Tuple[int, int], colors: Tuple[str, str]):
+        """
+        Recolor a single cell, touching the canvas only for the items whose
+        color actually changed.
+        """
+        last_fill, last_text_color = self._cell_colors[cell]
+        fill, text_color           = colors
+        rect_id, text_id           = self._cell_ids[cell]
 
+        if fill != last_fill:
+            self.canvas.itemconfig(rect_id, fill=fill)
+        if text_color != last_text_color:
+            self.canvas.itemconfig(text_id, fill=text_color)
 
-@dataclass
-class Node:
-    state: Tuple[int, int]
-    parent: Optional['Node']
+        self._cell_colors[cell] = colors
 
-    cost: int = 0
-    depth: int = 0
+    def draw_grid(self, path=None, current_position=None):
+        cell_kinds = self.grid.cell_kinds
 
-    def __hash__(self):
-        """
-        Custom __hash__ method for hashing the state of the Node rather than
-        the object.
-        """
-        return hash(self.state)
+        # NOTE: Start, goal and barrier cells keep their static colors; the
+        # path and current position are overlaid on every other cell.
+        overlay = {}
+        for cell in path or ():
+            if cell_kinds.get(cell, 'barrier') not in GUI_COLORS_BY_CELL_KIND:
+                overlay[cell] = ("blue", "white")
 
-    def __eq__(self, other: 'Node'):
-        """
-        Custom __eq__ method for comparing two Node instances by state.
-        """
-        if not isinstance(other, Node):
-            return TypeError('other must be an instance of Node')
+        if current_position and current_position not in overlay:
+            if cell_kinds.get(current_position, 'barrier') not in GUI_COLORS_BY_CELL_KIND:
+                overlay[current_position] = ("orange", "white")
 
-        return self.state == other.state
+        for cell in self._overlay.keys() | overlay.keys():
+            self._paint_cell(cell, overlay.get(cell, ("white", "black")))
 
-    def __lt__(self, other: 'Node'):
-        """
-        Custom __lt__ method for queue.PriorityQueue insert comparisons.
-        """
-        if not isinstance(other, Node):
-            return TypeError('other must be an instance of Node')
+        self._overlay = overlay
 
-        return self.cost < other.cost
+    def on_close(self):
+        self.stop_event.set()
+        self.window.destroy()
+
+    def run(self):
+        self.window.mainloop()
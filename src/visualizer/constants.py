@@ -67,5 +67,21 @@ DEFAULT_GRID_BY_STRATEGY_MAP = {
         start=(0, 0),
         goal=(4, 4),
         barriers=[(2, 2)]
+    ),
+    InformedSearchStrategy.AStarSearch: Grid(
+        width=5,
+        height=5,
+        start=(0, 0),
+        goal=(4, 4),
+        barriers=[(2, 2)],
+        increased_cost_cells={(3, 3): 5, (2, 1): 9}
+    ),
+    InformedSearchStrategy.GreedyBestFirstSearch: Grid(
+        width=5,
+        height=5,
+        start=(0, 0),
+        goal=(4, 4),
+        barriers=[(2, 2)],
+        increased_cost_cells={(3, 3): 5, (2, 1): 9}
     )
 }
@@ -1,12 +1,14 @@
 from typing import (
     Dict,
     List,
-    Tuple
+    Tuple,
+    Union
 )
 
 import settings
 from constants import (
     VisualizationMethod,
+    InformedSearchStrategy,
     UninformedSearchStrategy,
     DEFAULT_GRID_BY_STRATEGY_MAP
 )
@@ -14,7 +16,10 @@ from components import (
     Grid,
     GridGUI
 )
-from algorithms import UninformedSearch
+from algorithms import (
+    InformedSearch,
+    UninformedSearch
+)
 
 logger = settings.getLogger(__name__)
 
@@ -27,12 +32,19 @@ def exit_program():
     exit('Goodbye!')
 
 
-def get_search_strategy() -> UninformedSearchStrategy:
+def get_search_strategy() -> Union[UninformedSearchStrategy, InformedSearchStrategy]:
+    strategies = list(UninformedSearchStrategy) + list(InformedSearchStrategy)
+
     print('Uninformed Search Algorithms:')
     for idx, strategy in enumerate(UninformedSearchStrategy, start=1):
         print(f'{idx}. {strategy.value}')
     print()
 
+    print('Informed Search Algorithms:')
+    for idx, strategy in enumerate(InformedSearchStrategy, start=len(UninformedSearchStrategy) + 1):
+        print(f'{idx}. {strategy.value}')
+    print()
+
     while True:
         choice = input('Enter a strategy number ("q" to quit): ')
         if choice.lower() == settings.MAIN_EXIT_CHAR:
@@ -43,7 +55,7 @@ def get_search_strategy() -> UninformedSearchStrategy:
             if choice_idx < 0:
                 raise ValueError
 
-            strategy = list(UninformedSearchStrategy)[choice_idx]
+            strategy = strategies[choice_idx]
 
             return strategy
         except (ValueError, IndexError):
@@ -70,7 +82,7 @@ def get_visualizer_method() -> str:
             print('Invalid choice. Please try again.')
 
 
-def get_grid(strategy: UninformedSearchStrategy) -> Grid:
+def get_grid(strategy: Union[UninformedSearchStrategy, InformedSearchStrategy]) -> Grid:
     """
     Return a default grid configuration or have the user enter
     the configuration manually.
@@ -178,6 +190,12 @@ def get_grid(strategy: UninformedSearchStrategy) -> Grid:
                 cell_position = tuple(map(int, cell_position.split(',')))
                 cost = int(cost)
 
+                # NOTE: Every step must cost at least 1, which UCS and the A*
+                # Manhattan heuristic rely on to find the cheapest path
+                if cost < 1:
+                    print("Cell costs must be at least 1. Please enter a different cost.")
+                    continue
+
                 if cell_position in increased_cost_cells:
                     print("This cell already has a defined cost. Please enter a different position or finish adding.")
                     continue
@@ -223,13 +241,19 @@ def get_grid(strategy: UninformedSearchStrategy) -> Grid:
     return grid
 
 
-def run_search(strategy: UninformedSearchStrategy, grid: Grid, visualizer_method: VisualizationMethod):
+def run_search(
+    strategy: Union[UninformedSearchStrategy, InformedSearchStrategy],
+    grid: Grid,
+    visualizer_method: VisualizationMethod
+):
     """
     Run the algorithm search method utilizing the appropriate visualizer
     method.
     """
+    search_class = InformedSearch if strategy in InformedSearchStrategy else UninformedSearch
+
     if visualizer_method == VisualizationMethod.GUI:
-        search = UninformedSearch(
+        search = search_class(
             grid=grid,
             strategy=strategy,
             visualizer_method=visualizer_method
@@ -238,12 +262,15 @@ def run_search(strategy: UninformedSearchStrategy, grid: Grid, visualizer_method
         search.visualizer = gui
         gui.run()
     else:
-        search = UninformedSearch(
+        search = search_class(
             grid=grid,
             strategy=strategy,
             visualizer_method=visualizer_method
         )
         search.run()
 
+        if visualizer_method == VisualizationMethod.CLI and search.path:
+            grid.print_grid_cli(path=search.path)
+
     print(f'Final path: {search.path}')
     print(f'Final cost: {search.final_cost}')
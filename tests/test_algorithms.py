@@ -0,0 +1,191 @@
+import heapq
+import random
+
+import pytest
+
+from algorithms import (
+    InformedSearch,
+    UninformedSearch
+)
+from components import Grid
+from constants import (
+    InformedSearchStrategy,
+    UninformedSearchStrategy
+)
+
+SEEDS = range(200)
+
+
+def make_grid(seed: int, increased_costs: bool = True) -> Grid:
+    """
+    Build a random grid with barriers and, optionally, increased-cost cells.
+    """
+    rng    = random.Random(seed)
+    width  = rng.randint(1, 9)
+    height = rng.randint(1, 9)
+    cells  = [(x, y) for x in range(width) for y in range(height)]
+
+    start = rng.choice(cells)
+    goal  = rng.choice(cells)
+
+    return Grid(
+        width=width,
+        height=height,
+        start=start,
+        goal=goal,
+        barriers=[cell for cell in cells if cell not in (start, goal) and rng.random() < 0.25],
+        increased_cost_cells={cell: rng.randint(2, 9) for cell in cells if increased_costs and rng.random() < 0.3}
+    )
+
+
+def dijkstra(grid: Grid):
+    """
+    Reference cheapest path cost from start to goal, or None if unreachable.
+    """
+    best     = {grid.start: 0}
+    frontier = [(0, grid.start)]
+
+    while frontier:
+        cost, state = heapq.heappop(frontier)
+        if state == grid.goal:
+            return cost
+        if cost > best[state]:
+            continue
+
+        for neighbor, step_cost in grid.get_neighbors(state):
+            if cost + step_cost < best.get(neighbor, float('inf')):
+                best[neighbor] = cost + step_cost
+                heapq.heappush(frontier, (cost + step_cost, neighbor))
+
+    return None
+
+
+def assert_valid_path(grid: Grid, path, cost: int):
+    """
+    Check the path connects start to goal through open cells at the given cost.
+    """
+    assert path[0] == grid.start
+    assert path[-1] == grid.goal
+
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        assert abs(x1 - x2) + abs(y1 - y2) == 1
+        assert (x2, y2) not in grid.barriers
+
+    assert cost == sum(grid.increased_cost_cells.get(state, 1) for state in path[1:])
+
+
+def run(search, method=None):
+    """
+    Run the search through the given method, or through run() by default.
+    """
+    (method or search.run)()
+
+    return search
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_ucs_matches_dijkstra(seed):
+    grid     = make_grid(seed)
+    expected = dijkstra(grid)
+
+    for method in ('_ucs', 'search'):
+        search = UninformedSearch(grid=grid, strategy=UninformedSearchStrategy.UniformCostSearch)
+        run(search, getattr(search, method))
+
+        if expected is None:
+            assert search.path == []
+        else:
+            assert_valid_path(grid, search.path, search.final_cost)
+            assert search.final_cost == expected
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_a_star_matches_dijkstra(seed):
+    grid     = make_grid(seed)
+    expected = dijkstra(grid)
+    search   = run(InformedSearch(grid=grid, strategy=InformedSearchStrategy.AStarSearch))
+
+    if expected is None:
+        assert search.path == []
+    else:
+        assert_valid_path(grid, search.path, search.final_cost)
+        assert search.final_cost == expected
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_greedy_best_first_finds_a_valid_path(seed):
+    grid   = make_grid(seed)
+    search = run(InformedSearch(grid=grid, strategy=InformedSearchStrategy.GreedyBestFirstSearch))
+
+    if dijkstra(grid) is None:
+        assert search.path == []
+    else:
+        assert_valid_path(grid, search.path, search.final_cost)
+
+
+@pytest.mark.parametrize('increased_costs', [True, False])
+@pytest.mark.parametrize('seed', SEEDS)
+def test_bfs_matches_search(seed, increased_costs):
+    grid      = make_grid(seed, increased_costs=increased_costs)
+    reference = UninformedSearch(grid=grid, strategy=UninformedSearchStrategy.BreadthFirstSearch)
+    run(reference, reference.search)
+    search    = run(UninformedSearch(grid=grid, strategy=UninformedSearchStrategy.BreadthFirstSearch))
+
+    # NOTE: Both ends of a bidirectional search may settle on a different
+    # shortest path, so only the number of steps has to agree
+    assert len(search.path) == len(reference.path)
+    if search.path:
+        assert_valid_path(grid, search.path, search.final_cost)
+
+
+@pytest.mark.parametrize('depth_limit', [0, 1, 3])
+@pytest.mark.parametrize('seed', SEEDS)
+def test_depth_limited_search_respects_limit(seed, depth_limit):
+    grid   = make_grid(seed)
+    search = run(UninformedSearch(
+        grid=grid,
+        strategy=UninformedSearchStrategy.DepthLimitedSearch,
+        depth_limit=depth_limit
+    ))
+
+    if search.path:
+        assert_valid_path(grid, search.path, search.final_cost)
+        assert len(search.path) - 1 <= depth_limit
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_iterative_deepening_finds_a_valid_path(seed):
+    grid   = make_grid(seed)
+    search = run(UninformedSearch(grid=grid, strategy=UninformedSearchStrategy.IterativeDeepeningSearch))
+
+    assert bool(search.path) == (dijkstra(grid) is not None)
+    if search.path:
+        assert_valid_path(grid, search.path, search.final_cost)
+
+
+@pytest.mark.parametrize('depth_limit', [None, 0, 1, 3, 5])
+@pytest.mark.parametrize('seed', SEEDS)
+def test_dfs_matches_search(seed, depth_limit):
+    grid      = make_grid(seed)
+    strategy  = UninformedSearchStrategy.DepthFirstSearch if depth_limit is None else UninformedSearchStrategy.DepthLimitedSearch
+    reference = UninformedSearch(grid=grid, strategy=strategy, depth_limit=depth_limit)
+    run(reference, reference.search)
+    search    = run(UninformedSearch(grid=grid, strategy=strategy, depth_limit=depth_limit))
+
+    assert search.path == reference.path
+    assert search.final_cost == reference.final_cost
+    assert search.explored == reference.explored
+    assert search.depth_limit_hit == reference.depth_limit_hit
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_iterative_deepening_matches_search(seed):
+    grid      = make_grid(seed)
+    reference = UninformedSearch(grid=grid, strategy=UninformedSearchStrategy.IterativeDeepeningSearch)
+    # NOTE: Force each depth-limited pass through the generic search loop
+    reference._dfs = reference.search
+    run(reference)
+    search    = run(UninformedSearch(grid=grid, strategy=UninformedSearchStrategy.IterativeDeepeningSearch))
+
+    assert search.path == reference.path
+    assert search.final_cost == reference.final_cost